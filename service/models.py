@@ -33,6 +33,7 @@ from enum import Enum
 from decimal import Decimal
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import func
 
 logger = logging.getLogger("flask.app")
 
@@ -175,6 +176,12 @@ class Product(db.Model):
         logger.info("Processing all Products")
         return cls.query.all()
 
+    @classmethod
+    def count(cls) -> int:
+        """Returns the number of Products in the database"""
+        logger.info("Processing count of Products")
+        return db.session.query(func.count(cls.id)).scalar()
+
     @classmethod
     def find(cls, product_id: int):
         """Finds a Product by it's ID
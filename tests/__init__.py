@@ -0,0 +1,13 @@
+"""
+Test package for the Product Service
+
+The unit tests default to a shared in-memory SQLite database so they do not
+need a running PostgreSQL server. Export DATABASE_URI to run them against
+PostgreSQL instead (e.g. in a dedicated integration job).
+"""
+import os
+
+TEST_DATABASE_URI = "sqlite+pysqlite:///file:test?mode=memory&cache=shared&uri=true"
+
+# Must be set before the service package is imported, since it connects on import
+os.environ.setdefault("DATABASE_URI", TEST_DATABASE_URI)
@@ -0,0 +1,89 @@
+"""
+pytest configuration for the Product Service tests
+
+The suite can be run in parallel with pytest-xdist:
+    pytest -n auto
+
+Every xdist worker gets its own database (e.g. ``postgres_gw0``) so tests
+running in different workers never see each other's rows. The worker URI
+is exported as DATABASE_URI before any test module imports the service,
+which connects to the database on import.
+
+The database schema is created once per test session by the ``database``
+fixture, instead of once per test class.
+"""
+import os
+import logging
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
+
+
+def worker_database_uri(uri: str, worker_id: str) -> str:
+    """Returns the database URI with the xdist worker id appended to its name"""
+    url = make_url(uri)
+    if url.database in (None, "", ":memory:"):
+        return uri  # private to each process already
+    url = url.set(database=f"{url.database}_{worker_id}")
+    return url.render_as_string(hide_password=False)
+
+
+def create_database(uri: str):
+    """Creates the PostgreSQL database for the URI if it does not exist yet"""
+    url = make_url(uri)
+    if url.get_backend_name() != "postgresql":
+        return  # SQLite creates its databases on connect
+    engine = create_engine(url.set(database="postgres"), isolation_level="AUTOCOMMIT")
+    with engine.connect() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": url.database}
+        ).scalar()
+        if not exists:
+            conn.execute(text(f'CREATE DATABASE "{url.database}"'))
+    engine.dispose()
+
+
+def pytest_configure(config):  # pylint: disable=unused-argument
+    """Points each xdist worker at its own database"""
+    worker_id = os.getenv("PYTEST_XDIST_WORKER")
+    if not worker_id:
+        return
+    uri = worker_database_uri(os.environ["DATABASE_URI"], worker_id)
+    create_database(uri)
+    os.environ["DATABASE_URI"] = uri
+
+
+def enable_sqlite_savepoints(engine):
+    """Lets pysqlite honor BEGIN / SAVEPOINT so per-test rollbacks work"""
+
+    @event.listens_for(engine, "connect")
+    def _do_connect(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None  # stop pysqlite emitting its own BEGIN
+
+    @event.listens_for(engine, "begin")
+    def _do_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    """Configures the app for testing and creates the schema once for the whole session"""
+    # pylint: disable=import-outside-toplevel
+    # Importing the service already ran init_db() against DATABASE_URI
+    from service import app
+    from service.models import Product, db
+
+    app.config["TESTING"] = True
+    app.config["DEBUG"] = False
+    app.logger.setLevel(logging.CRITICAL)
+    if db.engine.dialect.name == "sqlite":
+        enable_sqlite_savepoints(db.engine)
+        # init_db() already connected; drop that connection so every pooled
+        # connection is opened through the hooks. An in-memory database goes
+        # away with its last connection, so the schema is created below
+        db.engine.dispose()
+    db.create_all()
+    db.session.query(Product).delete()  # start from an empty table
+    db.session.commit()
+    yield db
+    db.session.close()